@@ -1,19 +1,47 @@
+import functools
 import warnings
 
 import numpy as np
+from scipy import sparse
+from joblib import Parallel, effective_n_jobs
 
 from ..base import BaseEstimator, TransformerMixin
+from ..utils.fixes import delayed
 from ..utils.metaestimators import available_if
 from ..utils.validation import (
     _allclose_dense_sparse,
     _check_feature_names_in,
+    assert_all_finite,
     check_array,
 )
 
 
-def _identity(X):
-    """The identity function."""
-    return X
+def _njit_func(func):
+    """Compile `func` with numba, returning None when it cannot be compiled.
+
+    Raises an ImportError when numba is not installed, since compilation is
+    only attempted when the user explicitly requested it.
+    """
+    try:
+        import numba
+    except ImportError as exc:
+        raise ImportError(
+            "FunctionTransformer(jit=True) requires numba to be installed."
+        ) from exc
+    try:
+        # No fastmath (it changes NaN/inf semantics of the user's callable)
+        # and no parallel (reduction order would become nondeterministic):
+        # compilation must preserve what `func` computes.
+        return numba.njit(cache=True)(func)
+    except (TypeError, numba.core.errors.NumbaError):
+        # Not every callable is jittable (e.g. ufuncs or closures over
+        # arbitrary objects); silently fall back to the plain callable.
+        return None
+
+
+def _is_cfunc(func):
+    """Whether `func` looks like a numba ``cfunc``-compiled callable."""
+    return hasattr(func, "address") and hasattr(func, "ctypes")
 
 
 class FunctionTransformer(TransformerMixin, BaseEstimator):
@@ -61,6 +89,15 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
         False, this has no effect. Otherwise, if accept_sparse is false,
         sparse matrix inputs will cause an exception to be raised.
 
+    sparse_format : {'csr', 'csc'} or None, default=None
+        Sparse format that sparse input is converted to during validation.
+        Only used when ``validate=True`` and ``accept_sparse=True``. Prefer
+        'csc' when ``func`` operates column-wise, so that column slicing is
+        contiguous instead of scattered. If None, any sparse format is
+        accepted as is.
+
+        .. versionadded:: 1.1
+
     check_inverse : bool, default=True
        Whether to check that or ``func`` followed by ``inverse_func`` leads to
        the original inputs. It can be used for a sanity check, raising a
@@ -92,6 +129,39 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
 
         .. versionadded:: 0.18
 
+    jit : bool, default=False
+        Whether to compile ``func`` with :func:`numba.njit` during ``fit``.
+        Compilation fuses elementwise operations into a single pass over the
+        data, which can speed up cheap elementwise transformations on large
+        arrays, and preserves the floating point semantics of ``func``.
+        Requires numba to be installed. Callables that numba cannot compile
+        (e.g. NumPy ufuncs) are silently executed uncompiled.
+
+        .. versionadded:: 1.1
+
+    cache : bool, default=False
+        Whether to memoize the output of ``transform`` and, when
+        ``validate=True``, the validated form of the last input, keyed on
+        the identity and metadata of the input array. This avoids
+        re-running a costly ``func`` and re-scanning the input when the
+        same ``X`` object repeatedly traverses the transformer, e.g. during
+        a grid search over a pipeline. Only enable this when ``func`` is
+        deterministic and the input array is not mutated in place between
+        calls; note that the memo keeps references to recent inputs. The
+        memo is cleared by ``fit``.
+
+        .. versionadded:: 1.1
+
+    n_jobs : int, default=None
+        Number of threads used to run the ``check_inverse`` round trip on
+        chunks of the sampled rows during ``fit``. Chunking assumes that
+        ``func`` and ``inverse_func`` transform each row independently;
+        leave at the default otherwise. ``None`` means 1 (serial, a single
+        round trip over the whole sample). ``-1`` means using all
+        processors.
+
+        .. versionadded:: 1.1
+
     Attributes
     ----------
     n_features_in_ : int
@@ -133,30 +203,136 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
         *,
         validate=False,
         accept_sparse=False,
+        sparse_format=None,
         check_inverse=True,
         feature_names_out=None,
         kw_args=None,
         inv_kw_args=None,
+        jit=False,
+        cache=False,
+        n_jobs=None,
     ):
         self.func = func
         self.inverse_func = inverse_func
         self.validate = validate
         self.accept_sparse = accept_sparse
+        self.sparse_format = sparse_format
         self.check_inverse = check_inverse
         self.feature_names_out = feature_names_out
         self.kw_args = kw_args
         self.inv_kw_args = inv_kw_args
+        self.jit = jit
+        self.cache = cache
+        self.n_jobs = n_jobs
 
     def _check_input(self, X, *, reset):
         if self.validate:
-            return self._validate_data(X, accept_sparse=self.accept_sparse, reset=reset)
+            accept_sparse = self.accept_sparse
+            if self.sparse_format is not None:
+                if self.sparse_format not in ("csr", "csc"):
+                    raise ValueError(
+                        "sparse_format must be 'csr', 'csc' or None, got "
+                        f"{self.sparse_format!r}."
+                    )
+                if accept_sparse:
+                    # Let validation convert sparse input once, so that
+                    # `func` sees a predictable layout.
+                    accept_sparse = (self.sparse_format,)
+            # Only memoize the validated result when the user opted into
+            # caching: a hit skips the full finiteness/dtype scan, which is
+            # unsafe if the input is mutated in place between calls.
+            use_memo = self.cache
+            if use_memo:
+                key = (getattr(X, "shape", None), getattr(X, "dtype", None))
+                if not reset:
+                    last = getattr(self, "_last_validated", None)
+                    # The entry holds a reference to the input, so the
+                    # identity check cannot hit a recycled object.
+                    if last is not None and last[0] is X and last[1] == key:
+                        return last[2]
+            X_validated = self._validate_data(
+                X, accept_sparse=accept_sparse, reset=reset
+            )
+            if reset:
+                self._fit_dtype = getattr(X_validated, "dtype", None)
+            if use_memo:
+                # The same X object commonly traverses fit_transform and
+                # then transform again inside a pipeline.
+                self._last_validated = (X, key, X_validated)
+            return X_validated
         return X
 
+    def _no_revalidate(self, X):
+        """Whether `X` can skip `check_array` in `inverse_transform`.
+
+        True when `X` already has the dtype and layout that validation
+        produced during `fit`, i.e. it is typically the output of
+        `transform` fed back unchanged.
+        """
+        fit_dtype = getattr(self, "_fit_dtype", None)
+        if fit_dtype is None:
+            return False
+        if isinstance(X, np.ndarray):
+            return (
+                X.ndim == 2 and X.dtype == fit_dtype and X.flags["C_CONTIGUOUS"]
+            )
+        if sparse.issparse(X):
+            expected_formats = (
+                ("csr", "csc") if self.sparse_format is None else (self.sparse_format,)
+            )
+            return (
+                self.accept_sparse
+                and X.format in expected_formats
+                and X.dtype == fit_dtype
+            )
+        return False
+
+    def _round_trip_is_close(self, X_selected):
+        """Whether a transform/inverse_transform round trip recovers X."""
+        X_round_trip = self.inverse_transform(self.transform(X_selected))
+        if (
+            sparse.issparse(X_selected)
+            and sparse.issparse(X_round_trip)
+            and X_selected.format == X_round_trip.format
+            and X_selected.format in ("csr", "csc")
+            and np.array_equal(X_selected.indptr, X_round_trip.indptr)
+            and np.array_equal(X_selected.indices, X_round_trip.indices)
+        ):
+            # Identical sparsity structure: comparing the `.data` arrays is
+            # enough and avoids materializing the elementwise difference
+            # that `_allclose_dense_sparse` would build.
+            return np.allclose(
+                X_selected.data, X_round_trip.data, rtol=1e-7, atol=1e-9
+            )
+        return _allclose_dense_sparse(X_selected, X_round_trip)
+
     def _check_inverse_transform(self, X):
         """Check that func and inverse_func are the inverse."""
-        idx_selected = slice(None, None, max(1, X.shape[0] // 100))
-        X_round_trip = self.inverse_transform(self.transform(X[idx_selected]))
-        if not _allclose_dense_sparse(X[idx_selected], X_round_trip):
+        # Stride over the full data so that the sample covers the data
+        # distribution, while bounding the check to ~100 rows so that it
+        # stays O(1) in the dataset size.
+        step = X.shape[0] // 100 or 1
+        X_selected = X[slice(None, None, step)]
+        n_selected = X_selected.shape[0]
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs > 1 and n_selected >= 2 * n_jobs:
+            # Opted-in via n_jobs: run the round trips chunkwise with
+            # threads (func and inverse_func typically call into NumPy
+            # code that releases the GIL). This assumes row-independent
+            # callables, see the n_jobs docstring.
+            chunk_size = -(-n_selected // n_jobs)
+            bounds = range(0, n_selected, chunk_size)
+            is_close = all(
+                Parallel(n_jobs=n_jobs, prefer="threads")(
+                    delayed(self._round_trip_is_close)(
+                        X_selected[start : start + chunk_size]
+                    )
+                    for start in bounds
+                )
+            )
+        else:
+            is_close = self._round_trip_is_close(X_selected)
+        if not is_close:
             warnings.warn(
                 "The provided functions are not strictly"
                 " inverse of each other. If you are sure you"
@@ -183,11 +359,59 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
         self : object
             FunctionTransformer class instance.
         """
+        self._last_validated = None
         X = self._check_input(X, reset=True)
+        self._transform_cache = {}
+        self._compiled_func = None
+        self._feature_names_out_cache = None
+        if self.feature_names_out == "one-to-one" and hasattr(self, "n_features_in_"):
+            # Precompute the output names so that repeated introspection
+            # (e.g. by ColumnTransformer or set_output) does not rerun
+            # _check_feature_names_in and reallocate the object array.
+            self._feature_names_out_cache = np.asarray(
+                _check_feature_names_in(self, None), dtype=object
+            )
+        if self.jit and self.func is not None:
+            compiled = _njit_func(self.func)
+            if compiled is not None:
+                # Remember which callable was compiled so that a stale
+                # compiled version is never used if `func` is changed.
+                self._compiled_func = (self.func, compiled)
+                if isinstance(X, np.ndarray) and X.shape[0]:
+                    # Prewarm on a single row so that the compile latency is
+                    # paid in `fit` rather than on the first `transform`.
+                    try:
+                        self._transform(X[:1], func=self.func, kw_args=self.kw_args)
+                    except Exception:
+                        self._compiled_func = None
+        self._bound_transform = None
+        self._bound_inverse = None
+        if (
+            self.func is not None
+            and self._compiled_func is None
+            and not _is_cfunc(self.func)
+        ):
+            self._bound_transform = self._bind_func(self.func, self.kw_args)
+        if self.inverse_func is not None and not _is_cfunc(self.inverse_func):
+            self._bound_inverse = self._bind_func(self.inverse_func, self.inv_kw_args)
         if self.check_inverse and not (self.func is None or self.inverse_func is None):
             self._check_inverse_transform(X)
         return self
 
+    @staticmethod
+    def _bind_func(func, kw_args):
+        """Pre-bind `kw_args` into `func`, keeping a snapshot for staleness
+        checks.
+
+        The returned triplet is (func, kw_args snapshot, bound callable). The
+        bound callable is only used as long as the public `func`/`kw_args`
+        parameters still match the snapshot, so that changing them after
+        `fit` keeps taking effect.
+        """
+        if kw_args:
+            return (func, dict(kw_args), functools.partial(func, **kw_args))
+        return (func, kw_args, func)
+
     def transform(self, X):
         """Transform X using the forward function.
 
@@ -201,8 +425,84 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
         X_out : array-like, shape (n_samples, n_features)
             Transformed input.
         """
-        X = self._check_input(X, reset=False)
-        return self._transform(X, func=self.func, kw_args=self.kw_args)
+        if self.cache:
+            memo = getattr(self, "_transform_cache", None)
+            if memo is None:
+                memo = self._transform_cache = {}
+            key = (
+                id(X),
+                getattr(X, "shape", None),
+                getattr(getattr(X, "dtype", None), "str", None),
+            )
+            hit = memo.get(key)
+            # The entry keeps references to the X and func objects it was
+            # computed from, so their ids cannot be recycled and the
+            # identity checks below are exact; the kw_args snapshot also
+            # catches in-place edits.
+            if (
+                hit is not None
+                and hit[0] is X
+                and hit[1] is self.func
+                and hit[2] == self.kw_args
+            ):
+                return hit[3]
+            X_in, func_in = X, self.func
+            kw_in = dict(self.kw_args) if self.kw_args is not None else None
+        # Inline the `validate is False` no-op to keep the hot path free of
+        # the extra `_check_input` call.
+        if self.validate:
+            X = self._check_input(X, reset=False)
+        bound = getattr(self, "_bound_transform", None)
+        if bound is not None and bound[0] is self.func and bound[1] == self.kw_args:
+            X_out = bound[2](X)
+        else:
+            X_out = self._transform(X, func=self.func, kw_args=self.kw_args)
+        if self.cache:
+            if len(memo) >= 8:
+                memo.clear()
+            memo[key] = (X_in, func_in, kw_in, X_out)
+        return X_out
+
+    def transform_batch(self, Xs):
+        """Transform a sequence of arrays in a single vectorized call.
+
+        The arrays are stacked along the sample axis, transformed once and
+        the result is split back, which amortizes the per-call validation
+        and dispatch overhead when many small batches are transformed (e.g.
+        row-by-row streaming). ``func`` must preserve the number of samples.
+
+        .. versionadded:: 1.1
+
+        Parameters
+        ----------
+        Xs : list of {array-like, sparse matrix} of shape \
+                (n_samples_i, n_features)
+            Input arrays, all with the same number of features.
+
+        Returns
+        -------
+        X_outs : list of {ndarray, sparse matrix}
+            Transformed output, one entry per input array with the same
+            number of samples.
+        """
+        if not Xs:
+            return []
+        sizes = np.asarray([X.shape[0] for X in Xs])
+        if any(sparse.issparse(X) for X in Xs):
+            X_out = self.transform(sparse.vstack(Xs))
+        else:
+            X_out = self.transform(np.vstack(Xs))
+        offsets = np.cumsum(sizes)
+        if sparse.issparse(X_out):
+            if X_out.format not in ("csr", "csc"):
+                # e.g. stacking COO inputs yields COO, which cannot be
+                # sliced by rows.
+                X_out = X_out.tocsr()
+            return [
+                X_out[start:stop]
+                for start, stop in zip(np.append(0, offsets[:-1]), offsets)
+            ]
+        return np.split(X_out, offsets[:-1])
 
     def inverse_transform(self, X):
         """Transform X using the inverse function.
@@ -218,8 +518,23 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
             Transformed input.
         """
         if self.validate:
-            X = check_array(X, accept_sparse=self.accept_sparse)
-        return self._transform(X, func=self.inverse_func, kw_args=self.inv_kw_args)
+            if self._no_revalidate(X):
+                # Matching dtype/layout lets us skip the conversion work of
+                # check_array, but validate=True still promises finite
+                # values, so keep that check.
+                assert_all_finite(X)
+            else:
+                X = check_array(X, accept_sparse=self.accept_sparse)
+        bound = getattr(self, "_bound_inverse", None)
+        if (
+            bound is not None
+            and bound[0] is self.inverse_func
+            and bound[1] == self.inv_kw_args
+        ):
+            return bound[2](X)
+        return self._transform(
+            X, func=self.inverse_func, kw_args=self.inv_kw_args, inverse=True
+        )
 
     @available_if(lambda self: self.feature_names_out is not None)
     def get_feature_names_out(self, input_features=None):
@@ -253,6 +568,12 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
               arguments, `self` and `input_features`, and its return value is
               returned by this method.
         """
+        if input_features is None and self.feature_names_out == "one-to-one":
+            cached = getattr(self, "_feature_names_out_cache", None)
+            if cached is not None:
+                # Copy so that callers mutating the returned array cannot
+                # corrupt the cache.
+                return cached.copy()
         if hasattr(self, "n_features_in_") or input_features is not None:
             input_features = _check_feature_names_in(self, input_features)
         if self.feature_names_out == "one-to-one":
@@ -278,11 +599,49 @@ class FunctionTransformer(TransformerMixin, BaseEstimator):
             )
         return np.asarray(names_out, dtype=object)
 
-    def _transform(self, X, func=None, kw_args=None):
+    def _transform(self, X, func=None, kw_args=None, inverse=False):
         if func is None:
-            func = _identity
-
-        return func(X, **(kw_args if kw_args else {}))
+            if kw_args:
+                raise ValueError(
+                    "kw_args and inv_kw_args are only used when func and "
+                    "inverse_func, respectively, are provided. Pass the "
+                    "corresponding callable or remove the keyword arguments."
+                )
+            # Fast path: the identity transformation is a plain passthrough.
+            return X
+        else:
+            if _is_cfunc(func):
+                # A cfunc only supports scalar calls; looping over it from
+                # Python would be slower than any vectorized callable, so
+                # require a real ufunc instead.
+                raise TypeError(
+                    "func is a numba.cfunc-compiled callable, which only "
+                    "supports scalar calls. Compile it with numba.vectorize "
+                    "instead to obtain a ufunc that applies elementwise."
+                )
+            compiled = getattr(self, "_compiled_func", None)
+            if compiled is not None and compiled[0] is func:
+                try:
+                    return compiled[1](X, **kw_args) if kw_args else compiled[1](X)
+                except Exception:
+                    # numba compiles lazily, so compilation may only fail
+                    # here; disable the compiled version and fall back to
+                    # the plain callable.
+                    self._compiled_func = None
+        if kw_args:
+            # Specialize the keyword arguments into a partial that is reused
+            # across calls instead of expanding **kw_args every time. The
+            # forward and inverse directions each get their own slot so
+            # alternating transform/inverse_transform calls do not evict
+            # each other's partial. The snapshot comparison invalidates a
+            # slot when its kw_args change, even in place.
+            attr = "_specialized_inverse" if inverse else "_specialized_transform"
+            spec = getattr(self, attr, None)
+            if spec is None or spec[0] is not func or spec[1] != kw_args:
+                spec = self._bind_func(func, kw_args)
+                setattr(self, attr, spec)
+            return spec[2](X)
+        return func(X)
 
     def __sklearn_is_fitted__(self):
         """Return True since FunctionTransfomer is stateless."""
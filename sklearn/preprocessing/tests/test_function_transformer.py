@@ -3,7 +3,11 @@ import numpy as np
 from scipy import sparse
 
 from sklearn.preprocessing import FunctionTransformer
-from sklearn.utils._testing import assert_array_equal, assert_allclose_dense_sparse
+from sklearn.utils._testing import (
+    assert_allclose,
+    assert_array_equal,
+    assert_allclose_dense_sparse,
+)
 
 
 def _make_func(args_store, kwargs_store, func=lambda X, *a, **k: X):
@@ -99,6 +103,49 @@ def test_kw_arg_reset():
     assert_array_equal(F.transform(X), np.around(X, decimals=1))
 
 
+def test_kw_arg_update_after_fit():
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    F = FunctionTransformer(np.around, kw_args=dict(decimals=3)).fit(X)
+
+    # updating kw_args after fit must invalidate the pre-bound callable
+    F.kw_args["decimals"] = 1
+    assert_array_equal(F.transform(X), np.around(X, decimals=1))
+
+    F.kw_args = dict(decimals=2)
+    assert_array_equal(F.transform(X), np.around(X, decimals=2))
+
+
+def test_kw_args_per_direction_specialization():
+    # alternating transform/inverse_transform on an unfitted transformer
+    # must not evict each other's pre-bound partial
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    F = FunctionTransformer(
+        func=np.around,
+        inverse_func=np.around,
+        kw_args=dict(decimals=3),
+        inv_kw_args=dict(decimals=1),
+    )
+    F.transform(X)
+    F.inverse_transform(X)
+    forward = F._specialized_transform
+    inverse = F._specialized_inverse
+    F.transform(X)
+    F.inverse_transform(X)
+    assert F._specialized_transform is forward
+    assert F._specialized_inverse is inverse
+
+
+def test_kw_args_without_func():
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    trans = FunctionTransformer(kw_args=dict(decimals=3))
+
+    with pytest.raises(ValueError, match="kw_args and inv_kw_args"):
+        trans.transform(X)
+
+
 def test_inverse_transform():
     X = np.array([1, 4, 9, 16]).reshape((2, 2))
 
@@ -168,6 +215,82 @@ def test_check_inverse():
     assert len(record) == 0
 
 
+def test_check_inverse_parallel_chunks():
+    # with an explicit n_jobs the round-trip check is chunked over threads;
+    # the warning behaviour must not change
+    rng = np.random.RandomState(0)
+    X = rng.rand(2500, 3)
+
+    trans = FunctionTransformer(
+        func=np.expm1,
+        inverse_func=np.log1p,
+        check_inverse=True,
+        validate=True,
+        n_jobs=2,
+    )
+    with pytest.warns(None) as record:
+        trans.fit(X)
+    assert len(record) == 0
+
+    trans = FunctionTransformer(
+        func=np.sqrt,
+        inverse_func=np.around,
+        check_inverse=True,
+        validate=True,
+        n_jobs=2,
+    )
+    with pytest.warns(UserWarning, match="not strictly inverse"):
+        trans.fit(X)
+
+
+@pytest.mark.parametrize("sparse_format", ["csr", "csc"])
+def test_function_transformer_sparse_format(sparse_format):
+    X = sparse.coo_matrix(np.arange(10, dtype=np.float64).reshape((5, 2)))
+
+    trans = FunctionTransformer(
+        validate=True, accept_sparse=True, sparse_format=sparse_format
+    )
+    Xt = trans.fit_transform(X)
+    assert Xt.format == sparse_format
+
+
+def test_function_transformer_sparse_format_invalid():
+    X = sparse.csr_matrix(np.arange(10, dtype=np.float64).reshape((5, 2)))
+
+    trans = FunctionTransformer(
+        validate=True, accept_sparse=True, sparse_format="coo"
+    )
+    with pytest.raises(ValueError, match="sparse_format must be"):
+        trans.fit(X)
+
+
+def test_transform_batch():
+    X = np.linspace(0, 1, num=20).reshape((10, 2))
+    batches = [X[:3], X[3:4], X[4:]]
+
+    trans = FunctionTransformer(np.log1p)
+    results = trans.transform_batch(batches)
+
+    assert len(results) == len(batches)
+    for batch, out in zip(batches, results):
+        assert_array_equal(out, np.log1p(batch))
+
+    assert trans.transform_batch([]) == []
+
+
+@pytest.mark.parametrize("sparse_container", [sparse.csr_matrix, sparse.coo_matrix])
+def test_transform_batch_sparse(sparse_container):
+    X = sparse.csr_matrix(np.arange(10, dtype=np.float64).reshape((5, 2)))
+    batches = [sparse_container(X[:1]), sparse_container(X[1:])]
+
+    trans = FunctionTransformer(lambda X: X * 2, accept_sparse=True)
+    results = trans.transform_batch(batches)
+
+    assert len(results) == len(batches)
+    for batch, out in zip(batches, results):
+        assert_allclose_dense_sparse(out, batch * 2)
+
+
 def test_function_transformer_frame():
     pd = pytest.importorskip("pandas")
     X_df = pd.DataFrame(np.random.randn(100, 10))
@@ -350,3 +473,172 @@ def test_function_transformer_validate_inverse():
 
     trans.inverse_transform(X_trans)
     assert trans.n_features_in_ == X.shape[1]
+
+
+def test_function_transformer_inverse_skips_revalidation(monkeypatch):
+    # inverse_transform does not re-run check_array on arrays that already
+    # have the dtype and layout produced by validation in fit
+    from sklearn.preprocessing import _function_transformer as ft_module
+    from sklearn.utils import check_array
+
+    X = np.array([[1.0, 4.0], [9.0, 16.0]])
+    trans = FunctionTransformer(func=np.sqrt, inverse_func=np.square, validate=True)
+    X_trans = trans.fit_transform(X)
+
+    calls = []
+
+    def spy_check_array(*args, **kwargs):
+        calls.append(1)
+        return check_array(*args, **kwargs)
+
+    monkeypatch.setattr(ft_module, "check_array", spy_check_array)
+
+    assert_allclose(trans.inverse_transform(X_trans), X)
+    assert not calls
+
+    # inputs that do not match the dtype seen in fit are still validated
+    trans.inverse_transform(X_trans.astype(np.float32))
+    assert len(calls) == 1
+
+
+def test_function_transformer_inverse_validates_finiteness():
+    # the revalidation bypass must not weaken the finiteness check that
+    # validate=True promises
+    X = np.array([[1.0, 4.0], [9.0, 16.0]])
+    trans = FunctionTransformer(func=np.sqrt, inverse_func=np.square, validate=True)
+    trans.fit(X)
+
+    X_bad = np.array([[np.nan, 1.0], [2.0, np.inf]])
+    with pytest.raises(ValueError, match="Input contains"):
+        trans.inverse_transform(X_bad)
+
+
+def test_function_transformer_revalidation_cache(monkeypatch):
+    # with cache=True, the same X object seen during fit is not re-validated
+    # by transform; without it, every call validates
+    X = np.arange(10, dtype=np.float64).reshape((5, 2))
+
+    def make_spy(trans, calls):
+        orig_validate = trans._validate_data
+
+        def spy_validate_data(*args, **kwargs):
+            calls.append(1)
+            return orig_validate(*args, **kwargs)
+
+        monkeypatch.setattr(trans, "_validate_data", spy_validate_data)
+
+    trans = FunctionTransformer(func=np.log1p, validate=True, cache=True)
+    trans.fit(X)
+    calls = []
+    make_spy(trans, calls)
+
+    assert_array_equal(trans.transform(X), np.log1p(X))
+    assert not calls
+
+    # a different array object is validated again
+    trans.transform(X.copy())
+    assert len(calls) == 1
+
+    # without cache, validation runs on every call
+    trans = FunctionTransformer(func=np.log1p, validate=True)
+    trans.fit(X)
+    calls = []
+    make_spy(trans, calls)
+    trans.transform(X)
+    assert len(calls) == 1
+
+
+def test_function_transformer_cache():
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+    n_calls = []
+
+    def func(X):
+        n_calls.append(1)
+        return X * 2
+
+    trans = FunctionTransformer(func=func, cache=True)
+    X_out = trans.transform(X)
+    assert trans.transform(X) is X_out
+    assert len(n_calls) == 1
+
+    # a different array object is transformed again
+    assert_array_equal(trans.transform(X.copy()), X_out)
+    assert len(n_calls) == 2
+
+    # fit clears the memo
+    trans.fit(X)
+    trans.transform(X)
+    assert len(n_calls) == 3
+
+    # replacing func invalidates the entry even if the new callable happens
+    # to reuse the old one's id
+    trans.func = lambda X: X * 3
+    assert_array_equal(trans.transform(X), X * 3)
+
+    # same for kw_args, including in-place edits
+    trans.func = np.around
+    trans.kw_args = dict(decimals=3)
+    assert_array_equal(trans.transform(X), np.around(X, decimals=3))
+    trans.kw_args["decimals"] = 1
+    assert_array_equal(trans.transform(X), np.around(X, decimals=1))
+
+
+def test_function_transformer_jit():
+    pytest.importorskip("numba")
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    def func(X):
+        return X**2 + 3 * X
+
+    trans = FunctionTransformer(func=func, jit=True).fit(X)
+    assert trans._compiled_func is not None
+    assert_allclose(trans.transform(X), func(X))
+
+
+def test_function_transformer_jit_fallback():
+    pytest.importorskip("numba")
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    # ufuncs cannot be compiled by numba; the plain callable is used silently
+    trans = FunctionTransformer(func=np.log1p, jit=True).fit(X)
+    assert trans._compiled_func is None
+    assert_array_equal(trans.transform(X), np.log1p(X))
+
+
+def test_function_transformer_cfunc_rejected():
+    numba = pytest.importorskip("numba")
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    @numba.cfunc("float64(float64)")
+    def double(x):
+        return 2.0 * x
+
+    trans = FunctionTransformer(func=double)
+    with pytest.raises(TypeError, match="numba.vectorize"):
+        trans.transform(X)
+
+
+def test_function_transformer_numba_vectorize():
+    numba = pytest.importorskip("numba")
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+
+    @numba.vectorize(["float64(float64)"])
+    def double(x):
+        return 2.0 * x
+
+    # a vectorized callable is a true ufunc and needs no special casing
+    trans = FunctionTransformer(func=double)
+    assert_allclose(trans.transform(X), 2.0 * X)
+
+
+def test_function_transformer_jit_requires_numba():
+    try:
+        import numba  # noqa
+
+        pytest.skip("numba is installed")
+    except ImportError:
+        pass
+    X = np.linspace(0, 1, num=10).reshape((5, 2))
+    trans = FunctionTransformer(func=lambda X: X + 1, jit=True)
+    with pytest.raises(ImportError, match="requires numba"):
+        trans.fit(X)
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from sklearn.base import BaseEstimator
@@ -48,73 +50,121 @@ def test_safe_tags_no_get_tags(estimator, key, expected_results):
 
 ### Testing __sklearn_tags__() functionality
 
-def test_sklearn_tag1():
-    # simple test with adding one parameter to subclass of BaseEstimator 
-    newtag = "requires_y"
-    newtagval = True
-    class ACustomEstimator(BaseEstimator):
-        def __sklearn_tags__(self):
+# The custom estimators below are defined once at module scope instead of
+# inside each test body, so the class objects are not rebuilt on every test
+# call or rerun.
+
+newtag1 = "requires_y"
+newtagval1 = True
+newtag2 = "requires_z"
+newtagval2 = True
+
+
+class ACustomEstimator(BaseEstimator):
+    # tags are memoized on the class: computed once on first access, then
+    # returned as a deep copy so callers cannot mutate the cached values,
+    # not even nested ones such as the X_types list
+    def __sklearn_tags__(self):
+        cls = type(self)
+        if "_cached_tags" not in cls.__dict__:
             tags = super().__sklearn_tags__()
-            tags[newtag] = newtagval
-            return tags
-    testtags = ACustomEstimator().__sklearn_tags__()
-    assert newtag in testtags and newtagval == testtags[newtag]
+            tags[newtag1] = newtagval1
+            cls._cached_tags = tags
+        return copy.deepcopy(cls._cached_tags)
 
-def test_sklearn_tag_multi():
-    # test with adding multiple parameters to subclass of BaseEstimator 
-    newtag1 = "requires_y"
-    newtagval1 = True
-    newtag2 = "requires_z"
-    newtagval2 = True
-    class ACustomEstimator(BaseEstimator):
-        def __sklearn_tags__(self):
+
+class AMultiTagEstimator(BaseEstimator):
+    def __sklearn_tags__(self):
+        cls = type(self)
+        if "_cached_tags" not in cls.__dict__:
             tags = super().__sklearn_tags__()
             tags[newtag1] = newtagval1
-            tags[newtag2] = newtagval2        
-            return tags
+            tags[newtag2] = newtagval2
+            cls._cached_tags = tags
+        return copy.deepcopy(cls._cached_tags)
+
+
+class AListTagEstimator(BaseEstimator):
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag1] = [newtagval1]
+        return tags
+
+
+class AListTagExtendingEstimator(AListTagEstimator):
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag1].append(newtagval2)
+        return tags
+
+
+class ACustomMixin1(BaseEstimator):
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag1] = newtagval1
+        return tags
+
+
+class ACustomMixin2(ACustomMixin1):
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag2] = newtagval2
+        return tags
+
+
+class AFreeMixin1:
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag1] = newtagval1
+        return tags
+
+
+class AFreeMixin2:
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag2] = newtagval2
+        return tags
+
+
+class LotsOfMixins(AFreeMixin1, AFreeMixin2, BaseEstimator):
+    pass
+
+
+class AnOverwritingMixin(ACustomMixin1):
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        tags[newtag1] = False
+        return tags
+
+
+class NotUsingBaseEstimator:
+    def __sklearn_tags__(self):
+        return {"newtag": True}
+
+
+def test_sklearn_tag1():
+    # simple test with adding one parameter to subclass of BaseEstimator
     testtags = ACustomEstimator().__sklearn_tags__()
+    assert newtag1 in testtags and newtagval1 == testtags[newtag1]
+
+def test_sklearn_tag_multi():
+    # test with adding multiple parameters to subclass of BaseEstimator
+    testtags = AMultiTagEstimator().__sklearn_tags__()
     flag = newtag1 in testtags and newtagval1 == testtags[newtag1]
     flag and newtag2 in testtags and newtagval2 == testtags[newtag2]
 
     assert flag
 
 def test_sklearn_tag_extendtags():
-    # test with extending tags of a subclass of BaseEstimator 
-    newtag1 = "requires_y"
-    newtagval1 = True
-    newtagval2 = True
-    class ACustomEstimator(BaseEstimator):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1] = [newtagval1]
-            return tags
-    class ACustomEstimator2(ACustomEstimator):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1].append(newtagval2)
-            return tags            
-    testtags = ACustomEstimator2().__sklearn_tags__()
+    # test with extending tags of a subclass of BaseEstimator
+    testtags = AListTagExtendingEstimator().__sklearn_tags__()
     flag = newtag1 in testtags and newtagval1 in testtags[newtag1]
     flag and newtagval2 in testtags[newtag1]
 
     assert flag
 
 def test_sklearn_tag_nestedInheritance():
-    # check if tags exist in subclasses of the Mixins 
-    newtag1 = "requires_y"
-    newtagval1 = True
-    newtag2 = "requires_z"
-    newtagval2 = True
-    class ACustomMixin1(BaseEstimator):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1] = newtagval1
-            return tags
-    class ACustomMixin2(ACustomMixin1):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag2] = newtagval2
-            return tags
+    # check if tags exist in subclasses of the Mixins
     testtags = ACustomMixin2().__sklearn_tags__()
     flag = newtag1 in testtags and newtagval1 == testtags[newtag1]
     flag and newtag2 in testtags and newtagval2 == testtags[newtag2]
@@ -123,22 +173,6 @@ def test_sklearn_tag_nestedInheritance():
 
 def test_sklearn_tag_multiInheritance():
     # check if tags exist in with multiple inherited classes
-    newtag1 = "requires_y"
-    newtagval1 = True
-    newtag2 = "requires_z"
-    newtagval2 = True
-    class ACustomMixin1:
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1] = newtagval1
-            return tags
-    class ACustomMixin2:
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag2] = newtagval2
-            return tags
-    class LotsOfMixins(ACustomMixin1,ACustomMixin2,BaseEstimator):
-        pass
     testtags = LotsOfMixins().__sklearn_tags__()
     flag = newtag1 in testtags and newtagval1 == testtags[newtag1]
     flag and newtag2 in testtags and newtagval2 == testtags[newtag2]
@@ -148,32 +182,25 @@ def test_sklearn_tag_multiInheritance():
 
 def test_sklearn_tag_overwrite():
     # test overwriting tags
-    newtag1 = "requires_y"
-    newtagval1 = True
-    newtagval2 = False
-    class ACustomMixin1(BaseEstimator):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1] = newtagval1
-            return tags
-    class ACustomMixin2(ACustomMixin1):
-        def __sklearn_tags__(self):
-            tags = super().__sklearn_tags__()
-            tags[newtag1] = newtagval2
-            return tags
-    testtags = ACustomMixin2().__sklearn_tags__()
-    flag = newtag1 in testtags and newtagval2 == testtags[newtag1]
+    testtags = AnOverwritingMixin().__sklearn_tags__()
+    flag = newtag1 in testtags and testtags[newtag1] is False
     assert flag
 
 def test_safe_tag():
     # test _safe_tag with another non BaseEstimator
-    newtag1 = "newtag"
-    newtagval1 = True
-    class NotUsingBaseEstimator:
-        def __sklearn_tags__(self):
-            return {newtag1: newtagval1}
-
     testtags = _safe_tags(NotUsingBaseEstimator())
-    flag = newtag1 in testtags and newtagval1 == testtags[newtag1]
+    flag = "newtag" in testtags and testtags["newtag"] is True
     assert flag
 
+def test_sklearn_tag_cached():
+    # the class-level memo is computed on first access and deep-copied on
+    # the way out, so repeated calls agree without recomputing the
+    # inherited tags and mutating one result cannot corrupt the cache
+    est = ACustomEstimator()
+    first = est.__sklearn_tags__()
+    first["X_types"].append("sparse")
+    second = est.__sklearn_tags__()
+    assert "sparse" not in second["X_types"]
+    assert first is not second
+    assert ACustomEstimator.__dict__["_cached_tags"] == second
+